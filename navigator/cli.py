@@ -1,35 +1,112 @@
 """CLI for terminal-based graph navigation."""
 
-import argparse
-from curses import wrapper
+import os
+import sys
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import NoReturn
 
-from .navigator import navigation_loop
-from .tests import TESTCASES
+USAGE = "usage: navigator [-h] graph\n"
 
+# Valid graph selections (range membership is a constant-time check)
+GRAPHS = range(1, 9)
 
-def parse_args():
+# Help text, built once rather than on every parse
+HELP = (
+    f"{USAGE}\n"
+    f"User Study CLI: select a graph ({GRAPHS[0]}-{GRAPHS[-1]}) to visualize.\n"
+)
+
+
+def _usage_error(message: str) -> NoReturn:
+    """
+    Print usage and an error message, then exit with status 2.
+
+    Nothing has been set up yet when this is called, so the interpreter's
+    teardown is skipped with os._exit.
+    """
+    sys.stderr.write(f"{USAGE}error: {message}\n")
+    sys.stderr.flush()
+    os._exit(2)
+
+
+def parse_args() -> SimpleNamespace:
+    """Parse command-line arguments (memoized on the contents of sys.argv)."""
+    return _parse_argv(tuple(sys.argv[1:]))
+
+
+@lru_cache(maxsize=4)
+def _parse_argv(argv: tuple[str, ...]) -> SimpleNamespace:
     """
     @nlmeta
 
-    Parse command-line arguments.
+    Parse command-line arguments: a single positional graph number in GRAPHS.
+
+    -h/--help prints HELP and exits with status 0; any other invalid input is a usage error.
+
+    Args:
+        argv: The command-line arguments, excluding the program name
+
+    Returns:
+        A namespace with the selected graph number as `graph`.
 
     Dependencies:
-        .tests.create_test_cases: how test cases are created.
+        _usage_error: use to report invalid arguments (exits with status 2).
+        HELP: help text to print for -h/--help.
+        USAGE: usage line (printed by _usage_error).
+        GRAPHS: valid graph numbers.
     """
-    parser = argparse.ArgumentParser(description="User Study CLI")
-    parser.add_argument(
-        "graph",
-        type=int,
-        choices=range(1, 9),
-        help="Select a graph to visualize",
-    )
-    return parser.parse_args()
+    # Print usage on request
+    if "-h" in argv or "--help" in argv:
+        sys.stdout.write(HELP)
+        sys.exit(0)
+
+    # Exactly one positional argument is expected
+    if len(argv) != 1:
+        _usage_error("expected exactly one argument: graph")
+
+    # The graph must be an integer in the valid range
+    try:
+        graph = int(argv[0])
+    except ValueError:
+        graph = None
+    if graph not in GRAPHS:
+        _usage_error(
+            f"invalid graph: {argv[0]!r} (choose from {GRAPHS[0]}-{GRAPHS[-1]})"
+        )
+
+    return SimpleNamespace(graph=graph)
 
 
-def main():
+def main() -> None:
     """Main entrypoint for the CLI."""
     args = parse_args()
-    testcase = TESTCASES.get(args.graph)
-    assert testcase
 
-    wrapper(navigation_loop, testcase)
+    # Deferred so that `--help` and argument errors exit before loading curses
+    # or building the test cases
+    import curses
+
+    from .navigator import navigation_loop
+    from .tests import get_testcase
+
+    testcase = get_testcase(args.graph)
+    if testcase is None:
+        _usage_error(f"no test case for graph {args.graph}")
+
+    # Same terminal setup and teardown as curses.wrapper, without the extra frame
+    stdscr = curses.initscr()
+    try:
+        curses.noecho()
+        curses.cbreak()
+        stdscr.keypad(True)
+        try:
+            curses.start_color()
+        except curses.error:
+            pass
+
+        navigation_loop(stdscr, testcase)
+    finally:
+        stdscr.keypad(False)
+        curses.echo()
+        curses.nocbreak()
+        curses.endwin()
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import curses
+from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import Enum
+from functools import cache
+from typing import NamedTuple
 
 from .node import Node
 
@@ -19,7 +22,21 @@ class Key(Enum):
     QUIT = 5
 
 
-@dataclass(frozen=True)
+# Map curses key codes to Key enum
+KEY_MAP: dict[int, Key] = {
+    curses.KEY_UP: Key.UP,
+    curses.KEY_DOWN: Key.DOWN,
+    curses.KEY_LEFT: Key.LEFT,
+    curses.KEY_RIGHT: Key.RIGHT,
+    27: Key.QUIT,  # ESC key
+    ord("q"): Key.QUIT,
+}
+
+# Index step among siblings for the UP and DOWN keys
+SIBLING_STEP: dict[Key, int] = {Key.UP: -1, Key.DOWN: 1}
+
+
+@dataclass(frozen=True, slots=True)
 class NodeData:
     """Data for a node."""
 
@@ -33,17 +50,41 @@ class NodeData:
 class AnnotatedNode:
     """A node annotated with data."""
 
+    __slots__ = (
+        "node",
+        "data",
+        "height",
+        "descendants",
+        "parent",
+        "children",
+        "index_in_parent",
+        "label",
+        "descendant_text",
+    )
+
     def __init__(
         self,
         node: Node,
         data: NodeData,
         parent: AnnotatedNode | None = None,
-        children: list[AnnotatedNode] | None = None,
+        children: tuple[AnnotatedNode, ...] = (),
+        index_in_parent: int = -1,
     ):
         self.node = node
         self.data = data
+        # Copies of the hot NodeData fields, read directly by the render loops
+        self.height = data.height
+        self.descendants = data.descendants
         self.parent = parent
-        self.children = children or []
+        # NB: a tuple, since the tree is not modified after annotation
+        self.children = children
+        # Position of this node in its parent's children (-1 if not yet attached)
+        self.index_in_parent = index_in_parent
+        # Rendered text, formatted once rather than on every render
+        self.label = repr(node)
+        self.descendant_text = (
+            f" (+{data.descendants} more descendants)" if data.descendants else ""
+        )
 
     def __repr__(self):
         return self.node.__repr__()
@@ -73,6 +114,8 @@ class NavigatorState:
         Dependencies:
             .node.Node: class for tree structure.
             Key: enum for key codes.
+            AnnotatedNode.index_in_parent: use instead of searching the siblings list.
+            SIBLING_STEP: use for the index step of Key.UP and Key.DOWN.
         """
         if key == Key.QUIT:
             return None
@@ -87,18 +130,13 @@ class NavigatorState:
             if self.current_node.children:
                 self.current_node = self.current_node.children[0]
 
-        elif key == Key.UP or key == Key.DOWN:
-            # Move between siblings
-            if self.current_node.parent:
-                siblings = self.current_node.parent.children
-                current_index = siblings.index(self.current_node)
-
-                if key == Key.UP and current_index > 0:
-                    # Move to previous sibling
-                    self.current_node = siblings[current_index - 1]
-                elif key == Key.DOWN and current_index < len(siblings) - 1:
-                    # Move to next sibling
-                    self.current_node = siblings[current_index + 1]
+        elif key in SIBLING_STEP:
+            # Move to the previous (UP) or next (DOWN) sibling, if there is one
+            parent = self.current_node.parent
+            if parent:
+                new_index = self.current_node.index_in_parent + SIBLING_STEP[key]
+                if 0 <= new_index < len(parent.children):
+                    self.current_node = parent.children[new_index]
 
         return self.current_node
 
@@ -109,7 +147,15 @@ class NavigatorState:
         """
         @nlmeta
 
-        Recursively annotates a tree with NodeData.
+        Annotates a tree with NodeData.
+
+        Algorithm:
+        - Walk the tree in post-order using an explicit stack (no recursion), so that deep
+          trees do not hit the recursion limit or pay for a Python frame per node.
+        - Each stack frame holds a node, an iterator over its children, and the annotated
+          children collected so far.
+        - When a node's children are exhausted, build its NodeData and AnnotatedNode, wire up
+          the parent-child relationships, and hand the result to the frame below.
 
         Returns:
             The annotated version of the (tree rooted at the) node.
@@ -119,55 +165,100 @@ class NavigatorState:
             NodeData: dataclass for node data.
             AnnotatedNode: class for annotated nodes.
         """
-        # Recursively annotate all children
-        annotated_children: list[AnnotatedNode] = []
+        stack: list[tuple[Node, Iterator[Node], list[AnnotatedNode]]] = [
+            (node, iter(node.children), [])
+        ]
 
-        # Initialize tree height and descendant count
-        max_child_height = 0
-        total_descendants = 0
+        while True:
+            current, children, annotated_children = stack[-1]
+
+            # Descend into the next child, if any
+            child = next(children, None)
+            if child is not None:
+                stack.append((child, iter(child.children), []))
+                continue
+
+            # All children have been annotated, so finish this node
+            stack.pop()
+
+            # Initialize tree height and descendant count (each child counts itself)
+            max_child_height = 0
+            total_descendants = len(annotated_children)
+
+            # Process each child
+            for annotated_child in annotated_children:
+                # Update maximum child height
+                if annotated_child.height > max_child_height:
+                    max_child_height = annotated_child.height
+
+                # Add child's descendants to total descendants
+                total_descendants += annotated_child.descendants
+
+            # Create NodeData for this node
+            node_data = NodeData(
+                height=max_child_height + 1,
+                descendants=total_descendants,
+            )
 
-        # Process each child
-        for child in node.children:
-            # Recursively annotate the child
-            annotated_child = self._annotate_tree(child)
-            annotated_children.append(annotated_child)
+            # Create the annotated node with its (now final) children, but no parent yet
+            annotated_node = AnnotatedNode(
+                node=current,
+                data=node_data,
+                children=tuple(annotated_children),
+            )
 
-            # Update maximum child height
-            max_child_height = max(max_child_height, annotated_child.data.height)
+            # Point the children back at the annotated node
+            for i, annotated_child in enumerate(annotated_children):
+                annotated_child.parent = annotated_node
+                annotated_child.index_in_parent = i
 
-            # Add child's descendants plus the child itself to total descendants
-            total_descendants += annotated_child.data.descendants + 1
+            # Finish at the root, otherwise hand the annotated node to its parent's frame
+            if not stack:
+                return annotated_node
+            stack[-1][2].append(annotated_node)
 
-        # Calculate tree height for this node
-        height = max_child_height + 1
 
-        # Create NodeData for this node
-        node_data = NodeData(
-            height=height,
-            descendants=total_descendants,
-        )
+class RenderConfiguration(NamedTuple):
+    """A configuration for rendering the parent node."""
+
+    current_node: AnnotatedNode
+    # All siblings (the parent's children, shared rather than copied)
+    # NB: the visible siblings are siblings[start_before:current index]
+    # and siblings[current index + 1:end_after]
+    siblings: tuple[AnnotatedNode, ...]
+    start_before: int
+    end_after: int
+    sibling_height: int
 
-        # Create the annotated node without setting parent or children yet
-        annotated_node = AnnotatedNode(node=node, data=node_data)
+    @property
+    def siblings_before(self) -> tuple[AnnotatedNode, ...]:
+        """Visible siblings before the current node."""
+        return self.siblings[self.start_before : self.current_node.index_in_parent]
 
-        # Set up parent-child relationships for the annotated nodes
-        for child in annotated_children:
-            child.parent = annotated_node
-            annotated_node.children.append(child)
+    @property
+    def siblings_after(self) -> tuple[AnnotatedNode, ...]:
+        """Visible siblings after the current node."""
+        return self.siblings[self.current_node.index_in_parent + 1 : self.end_after]
 
-        return annotated_node
+    @property
+    def num_siblings_before(self) -> int:
+        """Number of visible siblings before the current node."""
+        return self.current_node.index_in_parent - self.start_before
 
+    @property
+    def num_siblings_after(self) -> int:
+        """Number of visible siblings after the current node."""
+        return self.end_after - self.current_node.index_in_parent - 1
 
-@dataclass(frozen=True)
-class RenderConfiguration:
-    """A configuration for rendering the parent node."""
+    @property
+    def non_visible_siblings_before(self) -> int:
+        """Number of siblings before the current node that are not visible."""
+        return self.start_before
 
-    current_node: AnnotatedNode
-    siblings_before: list[AnnotatedNode]
-    siblings_after: list[AnnotatedNode]
-    non_visible_siblings_before: int
-    non_visible_siblings_after: int
-    sibling_height: int
+    @property
+    def non_visible_siblings_after(self) -> int:
+        """Number of siblings after the current node that are not visible."""
+        return len(self.siblings) - self.end_after
 
     @classmethod
     def from_node(
@@ -202,36 +293,26 @@ class RenderConfiguration:
         # Get all siblings from the parent
         siblings = node.parent.children
 
-        # Find the index of the current node among siblings
-        current_index = siblings.index(node)
+        # Index of the current node among siblings
+        current_index = node.index_in_parent
 
         # Calculate which siblings to include before the current node
         start_before = max(0, current_index - visible_siblings_before)
-        siblings_before = siblings[start_before:current_index]
 
         # Calculate which siblings to include after the current node
         end_after = min(len(siblings), current_index + 1 + visible_siblings_after)
-        siblings_after = siblings[current_index + 1 : end_after]
 
-        # Calculate how many siblings are not visible
-        non_visible_siblings_before = current_index - len(siblings_before)
-        non_visible_siblings_after = (
-            len(siblings) - current_index - 1 - len(siblings_after)
-        )
-
-        # Return a new RenderConfiguration
+        # Return a new RenderConfiguration (spans into siblings, no list copies)
         return cls(
             current_node=node,
-            siblings_before=siblings_before,
-            siblings_after=siblings_after,
-            non_visible_siblings_before=non_visible_siblings_before,
-            non_visible_siblings_after=non_visible_siblings_after,
+            siblings=siblings,
+            start_before=start_before,
+            end_after=end_after,
             sibling_height=sibling_height,
         )
 
 
-@dataclass(frozen=True)
-class RenderResult:
+class RenderResult(NamedTuple):
     """A rendering result for a given configuration."""
 
     configuration: RenderConfiguration
@@ -239,6 +320,21 @@ class RenderResult:
     current_node_position: int
     total_rows_used: int
 
+    def sort_key(self, center_y: int) -> tuple[int, int, int, int]:
+        """
+        Key ordering results from worst to best (see NavigatorRenderer.compare_results).
+
+        Args:
+            center_y: The row the current node should ideally be rendered at
+        """
+        configuration = self.configuration
+        return (
+            self.current_node_height,
+            -abs(self.current_node_position - center_y),
+            configuration.num_siblings_before + configuration.num_siblings_after,
+            configuration.sibling_height,
+        )
+
 
 class Mode(Enum):
     """Mode for measure or render methods."""
@@ -247,12 +343,75 @@ class Mode(Enum):
     RENDER = 2
 
 
+@cache
+def connector_strings(offset: int) -> tuple[str, str]:
+    """
+    Connector strings for a given offset.
+
+    Returns:
+        A tuple of the connector for all but the last child ("├────") and the connector
+        for the last child ("└────").
+    """
+    return "├" + "─" * offset, "└" + "─" * offset
+
+
+FOOTER_TEXT = 'arrow keys to navigate, "ESC" or "q" to quit.'
+
+
+@cache
+def footer_layout(max_x: int) -> tuple[int, str]:
+    """
+    Footer position and text for a given terminal width.
+
+    Returns:
+        A tuple of the x position of the right-justified footer and the footer text,
+        truncated if it does not fit.
+    """
+    # Calculate position for right-justified text
+    x_pos = max_x - len(FOOTER_TEXT) - 1
+
+    # Truncate if too long
+    if x_pos < 0:
+        return 0, FOOTER_TEXT[:x_pos]
+    return x_pos, FOOTER_TEXT
+
+
 class NavigatorRenderer:
     """Renderer for the navigator."""
 
     def __init__(self, stdscr: curses.window, max_children: int = 100):
         self.max_children = max_children
         self.stdscr = stdscr
+        # Hide the cursor once; since it is hidden, curses need not move it back after each update
+        curses.curs_set(0)
+        self.stdscr.leaveok(True)
+        # Terminal dimensions (max_y, max_x), refreshed once per frame
+        self._dims: tuple[int, int] = stdscr.getmaxyx()
+        # Results of measure_shape; these do not depend on the terminal size
+        self._shape_cache: dict[
+            tuple[AnnotatedNode, int, int], tuple[int, int, int]
+        ] = {}
+        # Results of measure_tallest_tree, valid while the terminal size is unchanged
+        self._tallest_tree_cache: dict[
+            tuple[AnnotatedNode, int, int, int, int], tuple[int, int] | None
+        ] = {}
+        # Results of measure_or_render_tree (in MEASURE mode) for subtrees truncated by the
+        # screen, valid while the terminal size is unchanged
+        self._tree_measure_cache: dict[
+            tuple[AnnotatedNode, int, int, int, int], tuple[int, int] | None
+        ] = {}
+        # Results of find_best_result per current node, valid while the terminal size is unchanged
+        self._best_result_cache: dict[AnnotatedNode, RenderResult | None] = {}
+
+    def _refresh_dims(self) -> None:
+        """Re-read the terminal dimensions (e.g. after a resize)."""
+        dims = self.stdscr.getmaxyx()
+        if dims != self._dims:
+            # Measurements depend on the terminal size
+            self._tree_measure_cache.clear()
+            self._tallest_tree_cache.clear()
+            self._best_result_cache.clear()
+        self._dims = dims
 
     def measure_or_render_terminal(
         self,
@@ -282,21 +441,15 @@ class NavigatorRenderer:
             context: NavigatorRenderer.measure_or_render_tree: uses this function to render the terminal.
         """
         # Get terminal dimensions
-        max_y, max_x = self.stdscr.getmaxyx()
+        max_y, max_x = self._dims
 
         # Check if the position is within bounds
         if y >= max_y or x >= max_x:
             return False
 
-        # Format the node name
-        node_name = str(node)
-
-        # If the node has children, add the descendant count information
-        if node.data.descendants:
-            descendant_count = node.data.descendants
-            descendant_text = f" (+{descendant_count} more descendants)"
-        else:
-            descendant_text = ""
+        # Node name and descendant count information (empty if no children)
+        node_name = node.label
+        descendant_text = node.descendant_text
 
         # Check if the full text will fit on screen
         if x + len(node_name) + len(descendant_text) >= max_x:
@@ -305,20 +458,17 @@ class NavigatorRenderer:
         if mode == Mode.MEASURE:
             return True
 
+        # Without highlighting, write the name and descendant text in one call
+        if not highlight:
+            self.stdscr.addstr(y, x, node_name + descendant_text)
+            return True
+
         # Render the node name with highlighting
-        if highlight:
-            self.stdscr.attron(curses.A_REVERSE)
-            self.stdscr.addstr(y, x, node_name)
-            self.stdscr.attroff(curses.A_REVERSE)
-        else:
-            self.stdscr.addstr(y, x, node_name)
+        self.stdscr.addstr(y, x, node_name, curses.A_REVERSE)
 
         if descendant_text:
-            # Calculate position for descendant text (right after the node name)
-            desc_x = x + len(node_name)
-
-            # Add the descendant text without highlighting
-            self.stdscr.addstr(y, desc_x, descendant_text)
+            # Add the descendant text (right after the node name) without highlighting
+            self.stdscr.addstr(y, x + len(node_name), descendant_text)
 
         return True
 
@@ -359,10 +509,12 @@ class NavigatorRenderer:
 
         Args:
             x: X coordinate for the parent.
-            ys: List of Y coordinates for where the children branch off.
+            ys: List of Y coordinates for where the children branch off, in increasing order
+                (callers append them top to bottom as the children are laid out).
             offset: Horizontal offset for the length of the connector
 
         Dependencies:
+            connector_strings: the connector strings for a given offset.
             context: NavigatorRenderer.measure_or_render_tree: uses this function to draw the vertical connectors after the tree structure has been set.
             context: NavigatorRenderer.render_parent: uses this function to draw the vertical connectors after the tree structure has been set.
         """
@@ -370,35 +522,102 @@ class NavigatorRenderer:
             return
 
         # Get terminal dimensions
-        max_y, max_x = self.stdscr.getmaxyx()
+        max_y, max_x = self._dims
 
-        if max(ys) >= max_y:
+        # The y coordinates are sorted, so the last one is the largest
+        if ys[-1] >= max_y:
             raise ValueError("Y coordinates out of bounds")
 
         if x + offset + 1 >= max_x:
             raise ValueError("X coordinate out of bounds")
 
-        ys.sort()  # Sort the y coordinates to ensure correct order
+        # Connector strings are only built once per offset
+        connector_mid, connector_last = connector_strings(offset)
 
-        # Create horizontal connectors for each child
-        for i, child_y in enumerate(ys):
-            # Determine if this is the last child
-            is_last = i == len(ys) - 1
+        # All but the last child get the "├" connector, plus a vertical line
+        # (drawn in a single call) down to the next sibling
+        for child_y, next_y in zip(ys, ys[1:]):
+            self.stdscr.addstr(child_y, x, connector_mid)
+            if next_y - child_y > 1:
+                self.stdscr.vline(
+                    child_y + 1, x, curses.ACS_VLINE, next_y - child_y - 1
+                )
 
-            # Draw the appropriate connector
-            if is_last:
-                # Last child gets the "└" connector
-                connector = "└" + "─" * offset
-            else:
-                # Other children get the "├" connector
-                connector = "├" + "─" * offset
+        # Last child gets the "└" connector
+        self.stdscr.addstr(ys[-1], x, connector_last)
+
+    def measure_shape(
+        self,
+        node: AnnotatedNode,
+        height: int,
+        offset: int = 4,
+    ) -> tuple[int, int, int]:
+        """
+        @nlmeta
+
+        Measure the shape of a node and its children at a given height, ignoring the terminal size.
+
+        Follows the same layout rules as NavigatorRenderer.measure_or_render_tree
+        (terminal nodes, self.max_children and the "(+X more children)" placeholder),
+        but with no bounds checks. The shape only depends on the tree, so results are
+        cached for the lifetime of the renderer.
+
+        Args:
+            node: The node to measure
+            height: maximum height of the tree to measure
+            offset: Connector length for rendering children
+
+        Returns:
+            A tuple of the number of rows used, the actual height of the tree, and the
+            width required (relative to the node's x coordinate).
+
+        Dependencies:
+            context: NavigatorRenderer.measure_or_render_tree: uses this function to skip walking
+                subtrees that fit on the screen.
+        """
+        # Heights beyond the subtree's own height render identically
+        height = min(height, node.height - 1)
+
+        key = (node, height, offset)
+        shape = self._shape_cache.get(key)
+        if shape is not None:
+            return shape
+
+        node_text = node.label
+
+        # Terminal: "node_name (+X more descendants)"
+        if height == 0 or not node.children:
+            shape = (1, 0, len(node_text) + len(node.descendant_text))
+            self._shape_cache[key] = shape
+            return shape
+
+        # Determine how many children to show
+        visible_children = min(len(node.children), self.max_children)
+        if visible_children < len(node.children):
+            visible_children -= 1
+
+        total_rows = 1  # Start with 1 for the node itself
+        max_child_height = 0
+        width = len(node_text)
+
+        for i in range(visible_children):
+            child_rows, child_height, child_width = self.measure_shape(
+                node.children[i], height - 1, offset
+            )
+            total_rows += child_rows
+            max_child_height = max(max_child_height, child_height)
+            width = max(width, offset + 1 + child_width)
 
-            self.stdscr.addstr(child_y, x, connector)
+        # Placeholder for children beyond max_children
+        if len(node.children) > self.max_children:
+            more_children = len(node.children) - self.max_children
+            more_text = f"(+{more_children} more children)"
+            width = max(width, len(more_text))
+            total_rows += 1
 
-            # Draw vertical lines connecting siblings
-            if not is_last:
-                for line_y in range(child_y + 1, ys[i + 1]):
-                    self.stdscr.addstr(line_y, x, "│")
+        shape = (total_rows, max_child_height + 1, width)
+        self._shape_cache[key] = shape
+        return shape
 
     def measure_or_render_tree(
         self,
@@ -419,6 +638,8 @@ class NavigatorRenderer:
         - If the node has children, recursively render up to self.max_children children at height - 1.
         - If the node has more than self.max_children children, render a placeholder as an additional child "(+X more children)".
         - Return the number of rows used, or -1 for failutre.
+        - In MEASURE mode, reuse the result of an earlier walk from the same position (results
+          are kept until the terminal is resized).
 
         Dependencies:
             context: NavigatorRenderer.measure_or_render_siblings: uses this function to render the full display.
@@ -426,6 +647,8 @@ class NavigatorRenderer:
             context: NavigatorRenderer.measure_tallest_tree: uses this function to measure the tallest tree possible.
             NavigatorRenderer.measure_or_render_terminal: used to render a node as a terminal (rather than a tree).
             NavigatorRenderer.render_connectors: use to render connectors after tree structure has been set.
+            NavigatorRenderer.measure_shape: in MEASURE mode, use the precomputed shape when the
+                subtree fits above the bottom row of the screen.
 
         Args:
             node: The node to render
@@ -439,17 +662,42 @@ class NavigatorRenderer:
             None if the tree cannot be rendered.
             Otherwise, returns a tuple of the number of rows used and the actual height of the tree rendered.
         """
-        max_y, max_x = self.stdscr.getmaxyx()
+        max_y, max_x = self._dims
+
+        # Key of this walk in the measurement cache (MEASURE mode only)
+        key: tuple[AnnotatedNode, int, int, int, int] | None = None
+
+        # If the whole subtree fits above the bottom row, nothing is truncated by the
+        # screen, so the precomputed shape gives the exact measurement
+        if mode == Mode.MEASURE:
+            shape_rows, shape_height, shape_width = self.measure_shape(
+                node, height, offset
+            )
+            if y + shape_rows <= max_y - 1:
+                if x + shape_width >= max_x:
+                    return None
+                return (shape_rows, shape_height)
+
+            # Otherwise the screen truncates the subtree, so the measurement depends on the
+            # position; reuse an earlier walk from the same position (heights beyond the
+            # subtree's own height measure the same)
+            key = (node, x, y, min(height, node.height - 1), offset)
+            if key in self._tree_measure_cache:
+                return self._tree_measure_cache[key]
+            # Every failure below returns early, so record a failure until the walk succeeds
+            self._tree_measure_cache[key] = None
 
         # If height is 0 or node has no children, render as terminal
         if height == 0 or not node.children:
             if self.measure_or_render_terminal(node, x, y, mode):
+                if key is not None:
+                    self._tree_measure_cache[key] = (1, 0)
                 return (1, 0)  # Terminal node takes up 1 row, height 0
             else:
                 return None  # Failed to render
 
         # Render the node itself
-        node_text = str(node)
+        node_text = node.label
         if x + len(node_text) >= max_x or y >= max_y:
             return None
         if mode == Mode.RENDER:
@@ -508,7 +756,10 @@ class NavigatorRenderer:
         if mode == Mode.RENDER:
             self.render_connectors(x, child_ys, offset)
 
-        return (total_rows, max_child_height + 1)
+        result = (total_rows, max_child_height + 1)
+        if key is not None:
+            self._tree_measure_cache[key] = result
+        return result
 
     def measure_tallest_tree(
         self,
@@ -531,6 +782,8 @@ class NavigatorRenderer:
             - If child_height = 0 fails, return -1.
             - Otherwise, render one last time with child_height-1 and return the number of rows.
         - If no change in lines, leave the last rendered tree and just return the number of rows used.
+        - Stop without measuring once child_height reaches node.height: taller renders are identical.
+        - Results are cached per (node, x, y, max_rows, offset) until the terminal is resized.
 
         Args:
             state: The current navigator state
@@ -547,12 +800,24 @@ class NavigatorRenderer:
             None if the tree cannot be rendered.
             Otherwise, returns a tuple of the number of rows used and the height of the tree rendered.
         """
+        # Measuring is pure for a given terminal size, so reuse earlier probes
+        key = (node, x, y, max_rows, offset)
+        if key in self._tallest_tree_cache:
+            return self._tallest_tree_cache[key]
+
         # Start with height 0
         child_height = 0
         prev_rows = -1
+        tallest: tuple[int, int] | None
 
         # Incrementally increase height until we see no change in rows or encounter failure
         while True:
+            # Heights beyond the subtree's own height render identically, so the
+            # number of rows cannot change any more
+            if child_height >= node.height:
+                tallest = (prev_rows, child_height - 1)
+                break
+
             # Try rendering at the current height
             result = self.measure_or_render_tree(
                 node,
@@ -565,16 +830,14 @@ class NavigatorRenderer:
 
             # If rendering failed or exceeds max_rows, go back to the last successful height
             if result is None or (current_rows := result[0]) > max_rows:
-                # If we failed at height 0, return None
-                if child_height == 0:
-                    return None
-
-                # Return the last successful height
-                return (prev_rows, child_height - 1)
+                # If we failed at height 0, there is no valid rendering
+                tallest = None if child_height == 0 else (prev_rows, child_height - 1)
+                break
 
             # If the number of rows didn't change, we've reached maximum useful height
             if current_rows == prev_rows:
-                return (current_rows, child_height - 1)
+                tallest = (current_rows, child_height - 1)
+                break
 
             # Update tracking variables
             prev_rows = current_rows
@@ -582,6 +845,9 @@ class NavigatorRenderer:
             # Increment height for next iteration
             child_height += 1
 
+        self._tallest_tree_cache[key] = tallest
+        return tallest
+
     def render_tallest_tree(
         self,
         node: AnnotatedNode,
@@ -598,7 +864,7 @@ class NavigatorRenderer:
             NavigatorRenderer.measure_tallest_tree: use this function to measure the tallest tree.
             NavigatorRenderer.measure_or_render_tree: use this function to render the tree.
         """
-        y, _ = self.stdscr.getmaxyx()
+        y, _ = self._dims
 
         # First measure the tallest tree
         result = self.measure_tallest_tree(node, 0, 0, y - 1)
@@ -617,7 +883,7 @@ class NavigatorRenderer:
 
         # Overwrite and highlight the current node
         self.stdscr.attron(curses.A_REVERSE)
-        self.stdscr.addstr(0, 0, str(node))
+        self.stdscr.addstr(0, 0, node.label)
         self.stdscr.attroff(curses.A_REVERSE)
 
     def measure_or_render_siblings(
@@ -666,7 +932,7 @@ class NavigatorRenderer:
             context: NavigatorRenderer.render_parent: calls this function to search for a valid rendering configuration.
         """
         # Get terminal dimensions
-        max_y, max_x = self.stdscr.getmaxyx()
+        max_y, max_x = self._dims
         max_y -= 1  # Leave space for the footer line
 
         # Offset for children
@@ -709,10 +975,8 @@ class NavigatorRenderer:
         current_node_y = current_y
 
         # Calculate max_rows to leave space for siblings after and non-visible siblings after
-        remaining_siblings_rows = 0
-        for sibling in configuration.siblings_after:
-            # Estimate height for each sibling (at least 1 row per sibling)
-            remaining_siblings_rows += 1
+        # Estimate height for each sibling (at least 1 row per sibling)
+        remaining_siblings_rows = configuration.num_siblings_after
 
         # Add 1 row if there are non-visible siblings after
         if configuration.non_visible_siblings_after > 0:
@@ -786,13 +1050,15 @@ class NavigatorRenderer:
 
         # Overwrite and highlight the current node
         if (
-            child_x + len(str(configuration.current_node)) >= max_x
+            child_x + len(configuration.current_node.label) >= max_x
             or current_node_y >= max_y
         ):
             return None
         if mode == Mode.RENDER:
             self.stdscr.attron(curses.A_REVERSE)
-            self.stdscr.addstr(current_node_y, child_x, str(configuration.current_node))
+            self.stdscr.addstr(
+                current_node_y, child_x, configuration.current_node.label
+            )
             self.stdscr.attroff(curses.A_REVERSE)
 
         # Create and return the RenderResult
@@ -822,55 +1088,33 @@ class NavigatorRenderer:
 
         Dependencies:
             RenderResult: dataclass for a result.
+            RenderResult.sort_key: use to compare results as tuples.
             context: NavigatorRenderer.render_parent: uses this function to compare configurations.
                 See also documentation for which configurations are preferred.
         """
-        # 1. Compare current node height - prefer taller rendering
-        if result1.current_node_height > result2.current_node_height:
-            return 1
-        elif result1.current_node_height < result2.current_node_height:
-            return -1
-
-        # 2. If sibling heights are equal, compare how vertically centered the current node is
-        # within the screen
-        position1 = result1.current_node_position
-        position2 = result2.current_node_position
-        max_y, _ = self.stdscr.getmaxyx()
+        # Results compare by, in order of priority:
+        # 1. current node height - prefer taller rendering
+        # 2. how vertically centered the current node is within the screen
+        # 3. total number of visible siblings
+        # 4. sibling height
+        max_y, _ = self._dims
         center_y = max_y // 2
-        centering1 = abs(position1 - center_y)
-        centering2 = abs(position2 - center_y)
-
-        if centering1 < centering2:  # Less distance from center is better
-            return 1
-        elif centering1 > centering2:
-            return -1
+        key1 = result1.sort_key(center_y)
+        key2 = result2.sort_key(center_y)
 
-        # 3. If heights are equal, compare total number of visible siblings
-        config1 = result1.configuration
-        config2 = result2.configuration
-
-        siblings1 = len(config1.siblings_before) + len(config1.siblings_after)
-        siblings2 = len(config2.siblings_before) + len(config2.siblings_after)
-
-        if siblings1 > siblings2:
-            return 1
-        elif siblings1 < siblings2:
-            return -1
-
-        # 4. If sibling counts are equal, compare sibling height
-        if config1.sibling_height > config2.sibling_height:
+        if key1 > key2:
             return 1
-        elif config1.sibling_height < config2.sibling_height:
+        elif key1 < key2:
             return -1
 
         # If all criteria are equal, the configurations are equivalent
         return 0
 
-    def render_parent(self, state: NavigatorState) -> None:
+    def find_best_result(self, state: NavigatorState) -> RenderResult | None:
         """
         @nlmeta
 
-        Render the parent node.
+        Search for the best configuration of siblings around the current node.
 
         We should always render the number of non-visible siblings before and after the current node as special "+X more siblings" leafs
 
@@ -885,48 +1129,100 @@ class NavigatorRenderer:
         - For each configuration, try different distributions of siblings before and after the current node.
         - Increase the sibling height until the number of rows used doesn't change, or we fail to render.
         - If height=0 fails, break early (and move to the next num_siblings)
+        - Skip distributions that need more rows than the screen has, even with every row at height 1.
         - If we find a valid configuration, compare it with the best one so far.
+        - Stop early once no remaining configuration can compare better than the best one
+          (current node at full height, perfectly centered, and more siblings shown than remain).
 
         Args:
             state: The current navigator state
 
+        Returns:
+            The best measured result, or None if no configuration fits on the screen
+
+        Raises:
+            ValueError: If the current node has no parent
+
         Dependencies:
             RenderConfiguration: class for parent configuration.
             RenderResult: class for rendering result.
             NavigatorRenderer.measure_or_render_siblings: use to try rendering different configurations of siblings.
                 See also documentation for how to render the parent.
-            NavigatorRenderer.render_connectors: use to render connectors after tree structure has been set.
-            NavigatorRenderer.compare_results: use this function to compare configurations.
+            NavigatorRenderer.compare_results: defines how configurations compare.
+            RenderResult.sort_key: use to compare configurations (keep the best key alongside the best result).
         """
         # Ensure the current node has a parent
-        if not state.current_node.parent:
+        current_node = state.current_node
+        parent = current_node.parent
+        if not parent:
             raise ValueError("Current node must have a parent")
 
         # Get terminal dimensions
-        max_y, _ = self.stdscr.getmaxyx()
+        max_y, _ = self._dims
 
         # Each sibling needs at least 1 row, plus 1 row each for parent, current node, and bottom row
         max_sibling_rows = max(0, max_y - 2)
 
         # Initialize best result to None
         best_result: RenderResult | None = None
+        best_key: tuple[int, int, int, int] | None = None
         best_siblings: int | None = None
 
+        # Measurements made during this search, keyed by (start_before, end_after, sibling_height)
+        measured: dict[tuple[int, int, int], RenderResult | None] = {}
+
+        # Bind the names used in the innermost loop
+        measure_siblings = self.measure_or_render_siblings
+        measure_mode = Mode.MEASURE
+
         # Get the total number of siblings
-        total_siblings_available = len(state.current_node.parent.children) - 1
+        siblings = parent.children
+        num_children = len(siblings)
+        total_siblings_available = num_children - 1
+        current_index = current_node.index_in_parent
 
         # Run in a loop, decreasing the number of siblings
         # Start with the calculated maximum (or total available, whichever is smaller)
         max_siblings_to_try = min(max_sibling_rows, total_siblings_available)
-        max_height_to_try = state.current_node.parent.data.height
+        max_height_to_try = parent.height
+
+        # The current node can never be rendered taller than its own subtree
+        max_current_node_height = current_node.height - 1
+        center_y = max_y // 2
 
         # Try configurations with decreasing number of siblings
         for total_siblings in range(max_siblings_to_try, -1, -1):
 
+            # Stop once the best result renders the current node at full height, perfectly
+            # centered, and with more siblings than any remaining configuration can show:
+            # nothing left to try can compare better
+            if (
+                best_result is not None
+                and best_result.current_node_height == max_current_node_height
+                and best_result.current_node_position == center_y
+                and best_result.configuration.num_siblings_before
+                + best_result.configuration.num_siblings_after
+                > total_siblings
+            ):
+                break
+
             # Try different distributions of siblings before and after
             for siblings_before in range(total_siblings + 1):
                 siblings_after = total_siblings - siblings_before
 
+                # Every sibling, the current node and each "+X more siblings" placeholder
+                # takes at least one row, so skip splits that cannot fit at any height
+                start_before = max(0, current_index - siblings_before)
+                end_after = min(num_children, current_index + 1 + siblings_after)
+                min_rows_used = (
+                    end_after
+                    - start_before
+                    + (start_before > 0)
+                    + (end_after < num_children)
+                )
+                if min_rows_used > max_sibling_rows:
+                    continue
+
                 # Increase sibling height until no change or failure
                 prev_rows_used = -1
                 start_height = (
@@ -935,16 +1231,23 @@ class NavigatorRenderer:
                     else best_result.configuration.sibling_height
                 )
                 for sibling_height in range(start_height, max_height_to_try + 1):
-                    # Create configuration
-                    config = RenderConfiguration.from_node(
-                        state.current_node,
-                        siblings_before,
-                        siblings_after,
-                        sibling_height,
-                    )
-
-                    # Try rendering this configuration
-                    result = self.measure_or_render_siblings(config, mode=Mode.MEASURE)
+                    # Splits that clamp to the same visible span measure the same configuration
+                    key = (start_before, end_after, sibling_height)
+                    if key in measured:
+                        result = measured[key]
+                    else:
+                        # Create configuration from the span computed above for this split
+                        # (same fields as RenderConfiguration.from_node, without redoing the clamping)
+                        config = RenderConfiguration(
+                            current_node=current_node,
+                            siblings=siblings,
+                            start_before=start_before,
+                            end_after=end_after,
+                            sibling_height=sibling_height,
+                        )
+
+                        # Try rendering this configuration
+                        result = measured[key] = measure_siblings(config, measure_mode)
 
                     # Current height failed, so don't try to go any higher
                     if result is None:
@@ -957,16 +1260,47 @@ class NavigatorRenderer:
                     prev_rows_used = result.total_rows_used
 
                     # If this is our first successful result, or it's better than our current best
-                    if (
-                        best_result is None
-                        or self.compare_results(result, best_result) > 0
-                    ):
+                    # (comparing sort keys, as compare_results does)
+                    result_key = result.sort_key(center_y)
+                    if best_key is None or result_key > best_key:
                         best_result = result
+                        best_key = result_key
                         best_siblings = total_siblings
 
             if best_siblings and best_siblings - total_siblings > 2:
                 break
 
+        return best_result
+
+    def render_parent(self, state: NavigatorState) -> None:
+        """
+        @nlmeta
+
+        Render the parent node.
+
+        Algorithm:
+        The search only depends on the current node and the terminal size, so its result is
+        cached per current node (the cache is cleared when the terminal is resized).
+        Render the best configuration found, then the parent node on the top line.
+
+        Args:
+            state: The current navigator state
+
+        Dependencies:
+            NavigatorRenderer.find_best_result: use to search for the best configuration.
+            NavigatorRenderer.measure_or_render_siblings: use to render the best configuration.
+        """
+        # Ensure the current node has a parent
+        if not state.current_node.parent:
+            raise ValueError("Current node must have a parent")
+
+        # Look up the best configuration, searching only on the first visit
+        if state.current_node in self._best_result_cache:
+            best_result = self._best_result_cache[state.current_node]
+        else:
+            best_result = self.find_best_result(state)
+            self._best_result_cache[state.current_node] = best_result
+
         # If we found a valid configuration, render it
         if best_result is not None:
             try:
@@ -976,7 +1310,7 @@ class NavigatorRenderer:
                 )
 
                 # Render the parent node on the top line
-                parent_text = str(state.current_node.parent)
+                parent_text = state.current_node.parent.label
                 self.stdscr.addstr(0, 0, parent_text)
 
             except curses.error:
@@ -991,18 +1325,10 @@ class NavigatorRenderer:
 
         Dependencies:
             NavigatorState.handle_keypress: this function handles keypresses.
+            footer_layout: use this function for the (cached) position and text of the footer.
         """
-        max_y, max_x = self.stdscr.getmaxyx()
-        footer_text = 'arrow keys to navigate, "ESC" or "q" to quit.'
-
-        # Calculate position for right-justified text
-        x_pos = max_x - len(footer_text) - 1
-
-        # Truncate if too long
-        if x_pos < 0:
-            footer_text = footer_text[:x_pos]
-            x_pos = 0
-
+        max_y, max_x = self._dims
+        x_pos, footer_text = footer_layout(max_x)
         self.stdscr.addstr(max_y - 1, x_pos, footer_text)
 
     def render(self, state: NavigatorState) -> None:
@@ -1016,9 +1342,14 @@ class NavigatorRenderer:
             NavigatorRenderer.render_tallest_tree: use this function to render the tallest tree when there is no parent.
                 Remember to add highlighting for the current node in this case.
             NavigatorRenderer.render_footer: use this function to render the footer.
+            NavigatorRenderer._refresh_dims: call once per frame to read the terminal dimensions.
         """
-        # Clear the screen
-        self.stdscr.clear()
+        # Read the terminal dimensions once for the whole frame
+        self._refresh_dims()
+
+        # Erase the screen contents; unlike clear(), this does not force curses to
+        # repaint the whole terminal, so only the cells that changed are sent
+        self.stdscr.erase()
 
         if state.current_node.parent:
             self.render_parent(state)
@@ -1027,11 +1358,9 @@ class NavigatorRenderer:
 
         self.render_footer()
 
-        # Refresh the screen to display changes
-        self.stdscr.refresh()
-
-        # Hide the cursor
-        curses.curs_set(0)
+        # Stage the changes and send them to the terminal in a single update
+        self.stdscr.noutrefresh()
+        curses.doupdate()
 
 
 def navigation_loop(stdscr: curses.window, root: Node):
@@ -1041,37 +1370,46 @@ def navigation_loop(stdscr: curses.window, root: Node):
     Navigation loop for a node.
 
     ESC and 'q' keys exit the navigator.
+    The screen is only redrawn when the current node changes or the terminal is resized.
+    Keys that are already queued when a key arrives are handled together, with a single redraw.
 
     Dependencies:
         .node.Node: class for tree structure.
         NavigatorState: class for navigator state.
         NavigatorRenderer: class for rendering the navigator.
+        KEY_MAP: use to map curses key codes to keys.
     """
     state = NavigatorState(root)
     renderer = NavigatorRenderer(stdscr)
 
     # Main navigation loop
+    rendered_node: AnnotatedNode | None = None
+    resized = False
     while True:
-        # Render the current state
-        renderer.render(state)
-
-        # Get user input
+        # Render the current state, unless it is already on screen
+        # (keys that don't move, e.g. UP on the first sibling, leave the screen as is)
+        if resized or state.current_node is not rendered_node:
+            renderer.render(state)
+            rendered_node = state.current_node
+            resized = False
+
+        # Block for the next key, then drain keys that are already queued (e.g. from
+        # holding an arrow key) so that they are all handled before rendering once
         key_code = renderer.stdscr.getch()
-
-        # Map key code to Key enum
-        key = {
-            curses.KEY_UP: Key.UP,
-            curses.KEY_DOWN: Key.DOWN,
-            curses.KEY_LEFT: Key.LEFT,
-            curses.KEY_RIGHT: Key.RIGHT,
-            27: Key.QUIT,  # ESC key
-            ord("q"): Key.QUIT,
-        }.get(key_code)
-
-        # Wait for a valid keypress
-        if not key:
-            continue
-
-        # Handle keypress and get new current node (or None to exit)
-        if not state.handle_keypress(key):
-            return
+        renderer.stdscr.nodelay(True)
+        try:
+            while key_code != -1:
+                # A resize changes the layout even though the state is unchanged
+                if key_code == curses.KEY_RESIZE:
+                    resized = True
+
+                # Map key code to Key enum, ignoring other keys
+                key = KEY_MAP.get(key_code)
+
+                # Handle keypress (None means exit)
+                if key and not state.handle_keypress(key):
+                    return
+
+                key_code = renderer.stdscr.getch()
+        finally:
+            renderer.stdscr.nodelay(False)
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import random
+from collections.abc import Mapping
+from types import MappingProxyType
 
 from .node import Node
 
@@ -26,44 +28,89 @@ def make_tree(size: int, seed: int) -> Node:
     root = Node(name="0")
 
     # List to keep track of all nodes for random parent selection
-    nodes: list[Node] = [root]
+    # (preallocated; only nodes[:i] are real when node i is created)
+    nodes: list[Node] = [root] * size
+    randrange = random.randrange
 
     # Create remaining nodes
     for i in range(1, size):
         # Randomly select a parent from existing nodes
-        parent = random.choice(nodes)
+        # NB: same draw as random.choice(nodes[:i]), so the trees for a seed are unchanged
+        parent = nodes[randrange(i)]
 
-        # Create a new node with the selected parent
-        new_node = Node(name=str(i), parent=parent)
-
-        # Add the new node as a child to the parent
+        # Create a new node and add it as a child to the selected parent
+        # (add_child sets the parent, so it is not passed to the constructor as well)
+        new_node = Node(name=str(i))
         parent.add_child(new_node)
 
         # Add the new node to our list of nodes
-        nodes.append(new_node)
+        nodes[i] = new_node
 
     return root
 
 
-def create_test_cases() -> dict[int, Node]:
+# Arguments to make_tree (size, seed) for each test case
+# NB: test case i is stored at index i - 1
+TESTCASE_ARGS: tuple[tuple[int, int], ...] = (
+    (5, 1),
+    (10, 1),
+    (20, 1),
+    (40, 1),
+    (80, 1),
+    (500, 1),
+    (500, 2),
+    (500, 3),
+)
+
+
+def get_testcase(graph: int) -> Node | None:
+    """
+    @nlmeta
+
+    Create a single test case for the user study.
+    Only the requested tree is built.
+
+    Returns:
+        The root of the test case, or None if there is no such test case.
+
+    Dependencies:
+        TESTCASE_ARGS: arguments for each test case.
+        make_tree: creates a test case.
+    """
+    if not 1 <= graph <= len(TESTCASE_ARGS):
+        return None
+
+    size, seed = TESTCASE_ARGS[graph - 1]
+    return make_tree(size, seed)
+
+
+def create_test_cases() -> Mapping[int, Node]:
     """
     @nlmeta
 
-    Create test cases for the user study.
+    Create all test cases for the user study.
+
+    Returns:
+        A read-only mapping from graph number to the root of its test case.
 
     Dependencies:
+        TESTCASE_ARGS: arguments for each test case.
         make_tree: creates a test case.
     """
-    return {
-        1: make_tree(5, 1),
-        2: make_tree(10, 1),
-        3: make_tree(20, 1),
-        4: make_tree(40, 1),
-        5: make_tree(80, 1),
-        6: make_tree(500, 1),
-        7: make_tree(500, 2),
-        8: make_tree(500, 3),
-    }
-
-
-TESTCASES = create_test_cases()
+    return MappingProxyType(
+        {graph: make_tree(*args) for graph, args in enumerate(TESTCASE_ARGS, start=1)}
+    )
+
+
+def __getattr__(name: str) -> Mapping[int, Node]:
+    """
+    Build TESTCASES (all test cases) on first access, rather than at import time.
+
+    Raises:
+        AttributeError: For any other missing attribute.
+    """
+    if name == "TESTCASES":
+        global TESTCASES
+        TESTCASES = create_test_cases()
+        return TESTCASES
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")